@@ -1,8 +1,12 @@
 "Python-MIP interface to the HiGHS solver."
 
+import functools
 import glob
+import importlib.util
 import numbers
 import logging
+import math
+import operator
 import os.path
 import sys
 from typing import List, Optional, Tuple, Union
@@ -13,19 +17,26 @@ import mip
 
 logger = logging.getLogger(__name__)
 
-# try loading the solver library
+# try loading the solver library (its C API declarations are only parsed on
+# first use, see _load_highs)
 ffi = cffi.FFI()
+STATUS_ERROR = None
+_header_parsed = False
 try:
+    # numpy is needed for passing arrays to HiGHS
+    import numpy as np
+
     # first try user-defined path, if given
     ENV_KEY = "PMIP_HIGHS_LIBRARY"
     if ENV_KEY in os.environ:
         libfile = os.environ[ENV_KEY]
         logger.debug("Choosing HiGHS library {libfile} via {ENV_KEY}.")
     else:
-        # try library shipped with highspy packaged
-        import highspy
-
-        pkg_path = os.path.dirname(highspy.__file__)
+        # try library shipped with highspy package (without importing it)
+        spec = importlib.util.find_spec("highspy")
+        if spec is None or not spec.submodule_search_locations:
+            raise ModuleNotFoundError("No module named 'highspy'")
+        [pkg_path] = spec.submodule_search_locations
 
         # need library matching operating system
         platform = sys.platform.lower()
@@ -53,9 +64,7 @@ except Exception as e:
     logger.error(f"An error occurred while loading the HiGHS library:\n{e}")
     has_highs = False
 
-if has_highs:
-    ffi.cdef(
-        """
+HEADER = """
         /* * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * */
         /*                                                                       */
         /*    This file is part of the HiGHS linear optimization suite           */
@@ -679,9 +688,16 @@ if has_highs:
         
         HighsInt Highs_getScaledModelStatus(const void* highs);
     """
-    )
 
-    STATUS_ERROR = highslib.kHighsStatusError
+
+def _load_highs():
+    "Parse the C API declarations of the HiGHS library, once."
+    global STATUS_ERROR, _header_parsed
+    if not _header_parsed:
+        ffi.cdef(HEADER)
+        _header_parsed = True
+        STATUS_ERROR = highslib.kHighsStatusError
+    return highslib
 
 
 def check(status):
@@ -689,6 +705,39 @@ def check(status):
         raise mip.InterfacingError("Unknown error in call to HiGHS.")
 
 
+# index of a mip.Var or mip.Constr, usable with map()
+_get_idx = operator.attrgetter("idx")
+
+
+@functools.lru_cache(maxsize=None)
+def _encode(name: str) -> bytes:
+    "Encoded name of an option or info value, as expected by HiGHS."
+    return name.encode("UTF-8")
+
+
+def _int_ptr(array: "np.ndarray"):
+    "Pointer to the data of a numpy int32 array, to be passed to HiGHS."
+    return ffi.cast("HighsInt*", ffi.from_buffer(array))
+
+
+def _double_ptr(array: "np.ndarray"):
+    "Pointer to the data of a numpy float64 array, to be passed to HiGHS."
+    return ffi.cast("double*", ffi.from_buffer(array))
+
+
+def _view(cdata, dtype="float64") -> "np.ndarray":
+    "Numpy view (without copying) of a CFFI array, e.g., as filled by HiGHS."
+    return np.frombuffer(ffi.buffer(cdata), dtype=dtype)
+
+
+def _valid_coeffs(values: List[float], limit: float) -> bool:
+    "Whether all values are smaller than limit in absolute value (and not NaN)."
+    # sum is NaN iff one of the (finite) values is NaN, for which min/max don't work
+    return not values or (
+        -limit < min(values) and max(values) < limit and not math.isnan(sum(values))
+    )
+
+
 class SolverHighs(mip.Solver):
     def __init__(self, model: mip.Model, name: str, sense: str):
         if not has_highs:
@@ -700,10 +749,24 @@ class SolverHighs(mip.Solver):
 
         # Store reference to library so that it's not garbage-collected (when we
         # just use highslib in __del__, it had already become None)?!
-        self._lib = highslib
+        self._lib = _load_highs()
 
         super().__init__(model, name, sense)
 
+        # type conversion maps (built once, to avoid repeated lookups of the
+        # constants in the library)
+        self._var_type_map = {
+            mip.CONTINUOUS: self._lib.kHighsVarTypeContinuous,
+            mip.BINARY: self._lib.kHighsVarTypeInteger,
+            mip.INTEGER: self._lib.kHighsVarTypeInteger,
+        }
+        self._highs_type_map = {value: key for key, value in self._var_type_map.items()}
+        self._sense_map = {
+            mip.MAXIMIZE: self._lib.kHighsObjSenseMaximize,
+            mip.MINIMIZE: self._lib.kHighsObjSenseMinimize,
+        }
+        self._highs_sense_map = {value: key for key, value in self._sense_map.items()}
+
         # Model creation and initialization.
         self._model = highslib.Highs_create()
         self.set_objective_sense(sense)
@@ -712,6 +775,28 @@ class SolverHighs(mip.Solver):
         self._name: str = name
         self._num_int_vars = 0
 
+        # Number of columns and rows (including buffered ones), kept here to
+        # avoid calls to HiGHS.
+        self._num_cols = 0
+        self._num_rows = 0
+
+        # New columns and rows are buffered here and only passed to HiGHS (in a
+        # single call each) when the model is accessed next, see _flush().
+        self._col_obj: List[float] = []
+        self._col_lb: List[float] = []
+        self._col_ub: List[float] = []
+        self._col_start: List[int] = []
+        self._col_index: List[int] = []
+        self._col_value: List[float] = []
+        self._col_int: List[int] = []
+        self._col_name: List[Tuple[int, str]] = []
+        self._row_lower: List[float] = []
+        self._row_upper: List[float] = []
+        self._row_start: List[int] = []
+        self._row_index: List[int] = []
+        self._row_value: List[float] = []
+        self._row_name: List[Tuple[int, str]] = []
+
         # Also store solution (when available)
         self._x = []
         self._rc = []
@@ -720,73 +805,162 @@ class SolverHighs(mip.Solver):
         # Buffer string for storing names
         self._name_buffer = ffi.new(f"char[{self._lib.kHighsMaximumStringLength}]")
 
-        # type conversion maps
-        self._var_type_map = {
-            mip.CONTINUOUS: self._lib.kHighsVarTypeContinuous,
-            mip.BINARY: self._lib.kHighsVarTypeInteger,
-            mip.INTEGER: self._lib.kHighsVarTypeInteger,
-        }
-        self._highs_type_map = {value: key for key, value in self._var_type_map.items()}
+        # Scratch buffers for querying info values
+        self._int_scratch = ffi.new("int[1]")
+        self._double_scratch = ffi.new("double[1]")
+
+        # HiGHS rejects the bounds and matrix coefficients beyond these limits, but
+        # only when the buffered data is passed to it, so add_var and add_constr
+        # check them right away.
+        self._infinite_bound = self._get_double_option_value("infinite_bound")
+        self._large_matrix_value = self._get_double_option_value("large_matrix_value")
 
     def __del__(self):
         self._name_buffer = None
         self._lib.Highs_destroy(self._model)
 
     def _get_int_info_value(self: "SolverHighs", name: str) -> int:
-        value = ffi.new("int*")
-        check(self._lib.Highs_getIntInfoValue(self._model, name.encode("UTF-8"), value))
+        value = self._int_scratch
+        check(self._lib.Highs_getIntInfoValue(self._model, _encode(name), value))
         return value[0]
 
     def _get_double_info_value(self: "SolverHighs", name: str) -> float:
-        value = ffi.new("double*")
-        check(
-            self._lib.Highs_getDoubleInfoValue(self._model, name.encode("UTF-8"), value)
-        )
+        value = self._double_scratch
+        check(self._lib.Highs_getDoubleInfoValue(self._model, _encode(name), value))
         return value[0]
 
     def _get_int_option_value(self: "SolverHighs", name: str) -> int:
-        value = ffi.new("int*")
-        check(
-            self._lib.Highs_getIntOptionValue(self._model, name.encode("UTF-8"), value)
-        )
+        value = ffi.new("int[1]")
+        check(self._lib.Highs_getIntOptionValue(self._model, _encode(name), value))
         return value[0]
 
     def _get_double_option_value(self: "SolverHighs", name: str) -> float:
-        value = ffi.new("double*")
-        check(
-            self._lib.Highs_getDoubleOptionValue(
-                self._model, name.encode("UTF-8"), value
-            )
-        )
+        value = ffi.new("double[1]")
+        check(self._lib.Highs_getDoubleOptionValue(self._model, _encode(name), value))
         return value[0]
 
     def _get_bool_option_value(self: "SolverHighs", name: str) -> float:
-        value = ffi.new("bool*")
-        check(
-            self._lib.Highs_getBoolOptionValue(self._model, name.encode("UTF-8"), value)
-        )
+        value = ffi.new("bool[1]")
+        check(self._lib.Highs_getBoolOptionValue(self._model, _encode(name), value))
         return value[0]
 
     def _set_int_option_value(self: "SolverHighs", name: str, value: int):
-        check(
-            self._lib.Highs_setIntOptionValue(self._model, name.encode("UTF-8"), value)
-        )
+        check(self._lib.Highs_setIntOptionValue(self._model, _encode(name), value))
 
     def _set_double_option_value(self: "SolverHighs", name: str, value: float):
+        check(self._lib.Highs_setDoubleOptionValue(self._model, _encode(name), value))
+
+    def _set_bool_option_value(self: "SolverHighs", name: str, value: float):
+        check(self._lib.Highs_setBoolOptionValue(self._model, _encode(name), value))
+
+    def _change_coef(self: "SolverHighs", row: int, col: int, value: float):
+        "Overwrite a single coefficient in the matrix."
+        self._flush()
+        check(self._lib.Highs_changeCoeff(self._model, row, col, value))
+
+    def _flush(self: "SolverHighs"):
+        "Pass buffered columns and rows to HiGHS."
+        # Columns first, since buffered rows may refer to buffered columns (but
+        # add_var makes sure that it's never the other way around).
+        try:
+            if self._col_obj:
+                self._flush_cols()
+            if self._row_lower:
+                self._flush_rows()
+        except Exception:
+            # HiGHS rejected (some of) the buffered data, which is dropped below
+            # so that the model stays usable.
+            self._sync_dimensions()
+            self.model.vars.truncate(self._num_cols)
+            self.model.constrs.truncate(self._num_rows)
+            raise
+        finally:
+            self._clear_buffers()
+
+    def _clear_buffers(self: "SolverHighs"):
+        for buffer in (
+            self._col_obj,
+            self._col_lb,
+            self._col_ub,
+            self._col_start,
+            self._col_index,
+            self._col_value,
+            self._col_int,
+            self._col_name,
+            self._row_lower,
+            self._row_upper,
+            self._row_start,
+            self._row_index,
+            self._row_value,
+            self._row_name,
+        ):
+            buffer.clear()
+
+    def _flush_cols(self: "SolverHighs"):
+        obj = np.array(self._col_obj, dtype=np.float64)
+        lb = np.array(self._col_lb, dtype=np.float64)
+        ub = np.array(self._col_ub, dtype=np.float64)
+        start = np.array(self._col_start, dtype=np.int32)
+        index = np.array(self._col_index, dtype=np.int32)
+        value = np.array(self._col_value, dtype=np.float64)
+        # add_var already counted the buffered integer columns, which only
+        # holds again once HiGHS has made them integer
+        self._num_int_vars -= len(self._col_int)
         check(
-            self._lib.Highs_setDoubleOptionValue(
-                self._model, name.encode("UTF-8"), value
+            self._lib.Highs_addCols(
+                self._model,
+                obj.size,
+                _double_ptr(obj),
+                _double_ptr(lb),
+                _double_ptr(ub),
+                index.size,
+                _int_ptr(start),
+                _int_ptr(index),
+                _double_ptr(value),
             )
         )
+        if self._col_int:
+            int_cols = np.array(self._col_int, dtype=np.int32)
+            integrality = np.full(
+                int_cols.size, self._var_type_map[mip.INTEGER], dtype=np.int32
+            )
+            check(
+                self._lib.Highs_changeColsIntegralityBySet(
+                    self._model,
+                    int_cols.size,
+                    _int_ptr(int_cols),
+                    _int_ptr(integrality),
+                )
+            )
+            self._num_int_vars += int_cols.size
+        for col, name in self._col_name:
+            check(self._lib.Highs_passColName(self._model, col, name.encode("utf-8")))
 
-    def _set_bool_option_value(self: "SolverHighs", name: str, value: float):
+    def _flush_rows(self: "SolverHighs"):
+        lower = np.array(self._row_lower, dtype=np.float64)
+        upper = np.array(self._row_upper, dtype=np.float64)
+        start = np.array(self._row_start, dtype=np.int32)
+        index = np.array(self._row_index, dtype=np.int32)
+        value = np.array(self._row_value, dtype=np.float64)
         check(
-            self._lib.Highs_setBoolOptionValue(self._model, name.encode("UTF-8"), value)
+            self._lib.Highs_addRows(
+                self._model,
+                lower.size,
+                _double_ptr(lower),
+                _double_ptr(upper),
+                index.size,
+                _int_ptr(start),
+                _int_ptr(index),
+                _double_ptr(value),
+            )
         )
+        for row, name in self._row_name:
+            self._lib.Highs_passRowName(self._model, row, name.encode("utf-8"))
 
-    def _change_coef(self: "SolverHighs", row: int, col: int, value: float):
-        "Overwrite a single coefficient in the matrix."
-        check(self._lib.Highs_changeCoeff(self._model, row, col, value))
+    def _sync_dimensions(self: "SolverHighs"):
+        "Update the cached numbers of columns and rows from HiGHS."
+        self._num_cols = self._lib.Highs_getNumCol(self._model)
+        self._num_rows = self._lib.Highs_getNumRow(self._model)
 
     def _set_column(self: "SolverHighs", col: int, column: "mip.Column"):
         "Overwrite coefficients of one column."
@@ -810,27 +984,36 @@ class SolverHighs(mip.Solver):
         column: "mip.Column" = None,
         name: str = "",
     ):
-        col: int = self.num_cols()
-        check(self._lib.Highs_addCol(self._model, obj, lb, ub, 0, ffi.NULL, ffi.NULL))
-        if name:
-            check(self._lib.Highs_passColName(self._model, col, name.encode("utf-8")))
-        if var_type != mip.CONTINUOUS:
-            self._num_int_vars += 1
-            check(
-                self._lib.Highs_changeColIntegrality(
-                    self._model, col, self._lib.kHighsVarTypeInteger
-                )
+        col: int = self._num_cols
+        if column and any(not 0 <= cons.idx < self._num_rows for cons in column.constrs):
+            raise mip.InterfacingError(
+                "Column refers to a constraint that is not part of the model."
             )
-
+        if not (lb < self._infinite_bound and ub > -self._infinite_bound):
+            raise mip.InterfacingError(f"Invalid bounds for variable: [{lb}, {ub}].")
+        if column and not _valid_coeffs(column.coeffs, self._large_matrix_value):
+            raise mip.InterfacingError("Column has a too large or NaN coefficient.")
+        if column and self._row_lower:
+            # the column refers to buffered rows, which have to be added first
+            self._flush()
+
+        self._col_obj.append(obj)
+        self._col_lb.append(lb)
+        self._col_ub.append(ub)
+        self._col_start.append(len(self._col_index))
         if column:
-            # Can't use _set_column here, because the variable is not added to
-            # the mip.Model yet.
-            # self._set_column(col, column)
             for cons, coef in zip(column.constrs, column.coeffs):
-                self._change_coef(cons.idx, col, coef)
+                self._col_index.append(cons.idx)
+                self._col_value.append(coef)
+        if name:
+            self._col_name.append((col, name))
+        if var_type != mip.CONTINUOUS:
+            self._num_int_vars += 1
+            self._col_int.append(col)
+        self._num_cols += 1
 
     def add_constr(self: "SolverHighs", lin_expr: "mip.LinExpr", name: str = ""):
-        row: int = self.num_rows()
+        row: int = self._num_rows
 
         # equation expressed as two-sided inequality
         lower = -lin_expr.const
@@ -842,15 +1025,28 @@ class SolverHighs(mip.Solver):
         else:
             assert lin_expr.sense == mip.EQUAL
 
-        num_new_nz = len(lin_expr.expr)
-        index = ffi.new("int[]", [var.idx for var in lin_expr.expr.keys()])
-        value = ffi.new("double[]", [coef for coef in lin_expr.expr.values()])
-
-        check(
-            self._lib.Highs_addRow(self._model, lower, upper, num_new_nz, index, value)
-        )
+        # HiGHS would only notice invalid columns when the buffer is flushed
+        cols = list(map(_get_idx, lin_expr.expr))
+        if cols and (min(cols) < 0 or max(cols) >= self._num_cols):
+            raise mip.InterfacingError(
+                "Constraint refers to a variable that is not part of the model."
+            )
+        if not (lower < self._infinite_bound and upper > -self._infinite_bound):
+            raise mip.InterfacingError(
+                f"Invalid right-hand side of constraint: {-lin_expr.const}."
+            )
+        values = list(lin_expr.expr.values())
+        if not _valid_coeffs(values, self._large_matrix_value):
+            raise mip.InterfacingError("Constraint has a too large or NaN coefficient.")
+
+        self._row_lower.append(lower)
+        self._row_upper.append(upper)
+        self._row_start.append(len(self._row_index))
+        self._row_index.extend(cols)
+        self._row_value.extend(values)
         if name:
-            self._lib.Highs_passRowName(self._model, row, name.encode("utf-8"))
+            self._row_name.append((row, name))
+        self._num_rows += 1
 
     def add_lazy_constr(self: "SolverHighs", lin_expr: "mip.LinExpr"):
         raise NotImplementedError("HiGHS doesn't support lazy constraints!")
@@ -869,55 +1065,61 @@ class SolverHighs(mip.Solver):
         return self._get_double_info_value("mip_dual_bound")
 
     def get_objective(self: "SolverHighs") -> "mip.LinExpr":
+        self._flush()
         n = self.num_cols()
-        num_col = ffi.new("int*")
-        costs = ffi.new("double[]", n)
-        lower = ffi.new("double[]", n)
-        upper = ffi.new("double[]", n)
-        num_nz = ffi.new("int*")
+        num_col = ffi.new("int[1]")
+        costs = np.zeros(n, dtype=np.float64)
+        lower = np.zeros(n, dtype=np.float64)
+        upper = np.zeros(n, dtype=np.float64)
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getColsByRange(
                 self._model,
                 0,  # from_col
                 n - 1,  # to_col
                 num_col,
-                costs,
-                lower,
-                upper,
+                _double_ptr(costs),
+                _double_ptr(lower),
+                _double_ptr(upper),
                 num_nz,
                 ffi.NULL,  # matrix_start
                 ffi.NULL,  # matrix_index
                 ffi.NULL,  # matrix_value
             )
         )
+        # only visit the columns with non-zero cost
+        nz = np.flatnonzero(costs)
         obj_expr = mip.xsum(
-            costs[i] * self.model.vars[i] for i in range(n) if costs[i] != 0.0
+            coef * self.model.vars[i] for i, coef in zip(nz.tolist(), costs[nz].tolist())
         )
         obj_expr.add_const(self.get_objective_const())
         obj_expr.sense = self.get_objective_sense()
         return obj_expr
 
     def get_objective_const(self: "SolverHighs") -> numbers.Real:
-        offset = ffi.new("double*")
+        offset = ffi.new("double[1]")
         check(self._lib.Highs_getObjectiveOffset(self._model, offset))
         return offset[0]
 
     def _all_cols_continuous(self: "SolverHighs"):
+        self._flush()
         n = self.num_cols()
         self._num_int_vars = 0
-        integrality = ffi.new("int[]", [self._lib.kHighsVarTypeContinuous] * n)
+        integrality = np.full(n, self._var_type_map[mip.CONTINUOUS], dtype=np.int32)
         check(
             self._lib.Highs_changeColsIntegralityByRange(
-                self._model, 0, n - 1, integrality
+                self._model, 0, n - 1, _int_ptr(integrality)
             )
         )
 
     def _reset_var_types(self: "SolverHighs", var_types: List[str]):
-        integrality = ffi.new("int[]", [self._var_type_map[vt] for vt in var_types])
         n = self.num_cols()
+        integrality = np.fromiter(
+            map(self._var_type_map.__getitem__, var_types), dtype=np.int32, count=n
+        )
         check(
             self._lib.Highs_changeColsIntegralityByRange(
-                self._model, 0, n - 1, integrality
+                self._model, 0, n - 1, _int_ptr(integrality)
             )
         )
         self._num_int_vars = sum(1 for vt in var_types if vt != mip.CONTINUOUS)
@@ -943,6 +1145,7 @@ class SolverHighs(mip.Solver):
         self: "SolverHighs",
         relax: bool = False,
     ) -> "mip.OptimizationStatus":
+        self._flush()
         if relax:
             # Temporarily change variable types.
             # Original types are stored in list var_type.
@@ -980,11 +1183,11 @@ class SolverHighs(mip.Solver):
                     self._model, col_value, col_dual, row_value, row_dual
                 )
             )
-            self._x = [col_value[j] for j in range(n)]
-            self._rc = [col_dual[j] for j in range(n)]
+            self._x = _view(col_value).tolist()
+            self._rc = _view(col_dual).tolist()
 
             if self._has_dual_solution():
-                self._pi = [row_dual[i] for i in range(m)]
+                self._pi = _view(row_dual).tolist()
 
         if relax:
             # Undo the temporary changes.
@@ -1010,22 +1213,15 @@ class SolverHighs(mip.Solver):
         return 1 if self._has_primal_solution() else 0
 
     def get_objective_sense(self: "SolverHighs") -> str:
-        sense = ffi.new("int*")
+        sense = ffi.new("int[1]")
         check(self._lib.Highs_getObjectiveSense(self._model, sense))
-        sense_map = {
-            self._lib.kHighsObjSenseMaximize: mip.MAXIMIZE,
-            self._lib.kHighsObjSenseMinimize: mip.MINIMIZE,
-        }
-        return sense_map[sense[0]]
+        return self._highs_sense_map[sense[0]]
 
     def set_objective_sense(self: "SolverHighs", sense: str):
-        sense_map = {
-            mip.MAXIMIZE: self._lib.kHighsObjSenseMaximize,
-            mip.MINIMIZE: self._lib.kHighsObjSenseMinimize,
-        }
-        check(self._lib.Highs_changeObjectiveSense(self._model, sense_map[sense]))
+        check(self._lib.Highs_changeObjectiveSense(self._model, self._sense_map[sense]))
 
     def set_start(self: "SolverHighs", start: List[Tuple["mip.Var", numbers.Real]]):
+        self._flush()
         # using zeros for unset variables
         nvars = len(self.model.vars)
         cval = ffi.new("double[]", [0.0 for _ in range(nvars)])
@@ -1035,9 +1231,26 @@ class SolverHighs(mip.Solver):
         self._lib.Highs_setSolution(self._model, cval, ffi.NULL, ffi.NULL, ffi.NULL)
 
     def set_objective(self: "SolverHighs", lin_expr: "mip.LinExpr", sense: str = ""):
-        # set coefficients
-        for var, coef in lin_expr.expr.items():
-            check(self._lib.Highs_changeColCost(self._model, var.idx, coef))
+        self._flush()
+        # set coefficients of all columns in one call (also resetting those
+        # that are not part of the new objective)
+        n = self.num_cols()
+        costs = np.zeros(n, dtype=np.float64)
+        num_terms = len(lin_expr.expr)
+        cols = np.fromiter(map(_get_idx, lin_expr.expr), dtype=np.int32, count=num_terms)
+        # negative indices would silently wrap around to the last columns
+        if num_terms and (cols.min() < 0 or cols.max() >= n):
+            raise mip.InterfacingError(
+                "Objective refers to a variable that is not part of the model."
+            )
+        costs[cols] = np.fromiter(
+            lin_expr.expr.values(), dtype=np.float64, count=num_terms
+        )
+        check(
+            self._lib.Highs_changeColsCostByRange(
+                self._model, 0, n - 1, _double_ptr(costs)
+            )
+        )
 
         self.set_objective_const(lin_expr.const)
         if lin_expr.sense:
@@ -1099,20 +1312,24 @@ class SolverHighs(mip.Solver):
         self._set_int_option_value("threads", threads)
 
     def write(self: "SolverHighs", file_path: str):
+        self._flush()
         check(self._lib.Highs_writeModel(self._model, file_path.encode("utf-8")))
 
     def read(self: "SolverHighs", file_path: str):
+        self._flush()
         if file_path.lower().endswith(".bas"):
             raise NotImplementedError("HiGHS does not support bas files")
         check(self._lib.Highs_readModel(self._model, file_path.encode("utf-8")))
+        self._sync_dimensions()
 
     def num_cols(self: "SolverHighs") -> int:
-        return self._lib.Highs_getNumCol(self._model)
+        return self._num_cols
 
     def num_rows(self: "SolverHighs") -> int:
-        return self._lib.Highs_getNumRow(self._model)
+        return self._num_rows
 
     def num_nz(self: "SolverHighs") -> int:
+        self._flush()
         return self._lib.Highs_getNumNz(self._model)
 
     def num_int(self: "SolverHighs") -> int:
@@ -1151,13 +1368,14 @@ class SolverHighs(mip.Solver):
     # Constraint-related getters/setters
 
     def constr_get_expr(self: "SolverHighs", constr: "mip.Constr") -> "mip.LinExpr":
+        self._flush()
         row = constr.idx
         # Call method twice:
         #  - first, to get the sizes for coefficients,
-        num_row = ffi.new("int*")
+        num_row = ffi.new("int[1]")
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         # TODO: We also pass a non-NULL matrix_start, which should not be
         # needed, but works around a known bug in HiGHS' C API.
         _tmp_matrix_start = ffi.new("int[]", 1)
@@ -1199,8 +1417,10 @@ class SolverHighs(mip.Solver):
                 )
             )
             expr = mip.xsum(
-                matrix_value[i] * self.model.vars[matrix_index[i]]
-                for i in range(num_nz[0])
+                coef * self.model.vars[col]
+                for col, coef in zip(
+                    _view(matrix_index, np.int32).tolist(), _view(matrix_value).tolist()
+                )
             )
 
         # Also set sense and constant
@@ -1235,11 +1455,12 @@ class SolverHighs(mip.Solver):
             self._change_coef(constr.idx, var.idx, coef)
 
     def constr_get_rhs(self: "SolverHighs", idx: int) -> numbers.Real:
+        self._flush()
         # fetch both lower and upper bound
-        num_row = ffi.new("int*")
+        num_row = ffi.new("int[1]")
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getRowsByRange(
                 self._model,
@@ -1264,11 +1485,12 @@ class SolverHighs(mip.Solver):
         return lower[0]
 
     def constr_set_rhs(self: "SolverHighs", idx: int, rhs: numbers.Real):
+        self._flush()
         # first need to figure out which bound to change (lower or upper)
-        num_row = ffi.new("int*")
+        num_row = ffi.new("int[1]")
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getRowsByRange(
                 self._model,
@@ -1295,6 +1517,7 @@ class SolverHighs(mip.Solver):
         check(self._lib.Highs_changeRowBounds(self._model, idx, lb, ub))
 
     def constr_get_name(self: "SolverHighs", idx: int) -> str:
+        self._flush()
         name = self._name_buffer
         check(self._lib.Highs_getRowName(self._model, idx, name))
         return ffi.string(name).decode("utf-8")
@@ -1318,12 +1541,20 @@ class SolverHighs(mip.Solver):
             raise ValueError(f"Invalid constraint sense: {expr.sense}")
 
     def remove_constrs(self: "SolverHighs", constrsList: List[int]):
+        self._flush()
         set_ = ffi.new("int[]", constrsList)
         check(self._lib.Highs_deleteRowsBySet(self._model, len(constrsList), set_))
+        self._sync_dimensions()
 
     def constr_get_index(self: "SolverHighs", name: str) -> int:
-        idx = ffi.new("int *")
-        self._lib.Highs_getRowByName(self._model, name.encode("utf-8"), idx)
+        if not name:
+            # unnamed rows can't be looked up
+            return -1
+        self._flush()
+        idx = ffi.new("int[1]")
+        status = self._lib.Highs_getRowByName(self._model, name.encode("utf-8"), idx)
+        if status == STATUS_ERROR:
+            return -1
         return idx[0]
 
     # Variable-related getters/setters
@@ -1340,11 +1571,12 @@ class SolverHighs(mip.Solver):
         pass
 
     def var_get_lb(self: "SolverHighs", var: "mip.Var") -> numbers.Real:
-        num_col = ffi.new("int*")
+        self._flush()
+        num_col = ffi.new("int[1]")
         costs = ffi.new("double[]", 1)
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getColsByRange(
                 self._model,
@@ -1363,16 +1595,18 @@ class SolverHighs(mip.Solver):
         return lower[0]
 
     def var_set_lb(self: "SolverHighs", var: "mip.Var", value: numbers.Real):
+        self._flush()
         # can only set both bounds, so we just set the old upper bound
         old_upper = self.var_get_ub(var)
         check(self._lib.Highs_changeColBounds(self._model, var.idx, value, old_upper))
 
     def var_get_ub(self: "SolverHighs", var: "mip.Var") -> numbers.Real:
-        num_col = ffi.new("int*")
+        self._flush()
+        num_col = ffi.new("int[1]")
         costs = ffi.new("double[]", 1)
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getColsByRange(
                 self._model,
@@ -1391,16 +1625,18 @@ class SolverHighs(mip.Solver):
         return upper[0]
 
     def var_set_ub(self: "SolverHighs", var: "mip.Var", value: numbers.Real):
+        self._flush()
         # can only set both bounds, so we just set the old lower bound
         old_lower = self.var_get_lb(var)
         check(self._lib.Highs_changeColBounds(self._model, var.idx, old_lower, value))
 
     def var_get_obj(self: "SolverHighs", var: "mip.Var") -> numbers.Real:
-        num_col = ffi.new("int*")
+        self._flush()
+        num_col = ffi.new("int[1]")
         costs = ffi.new("double[]", 1)
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getColsByRange(
                 self._model,
@@ -1419,10 +1655,12 @@ class SolverHighs(mip.Solver):
         return costs[0]
 
     def var_set_obj(self: "SolverHighs", var: "mip.Var", value: numbers.Real):
+        self._flush()
         check(self._lib.Highs_changeColCost(self._model, var.idx, value))
 
     def var_get_var_type(self: "SolverHighs", var: "mip.Var") -> str:
-        var_type = ffi.new("int*")
+        self._flush()
+        var_type = ffi.new("int[1]")
         ret = self._lib.Highs_getColIntegrality(self._model, var.idx, var_type)
         if var_type[0] not in self._highs_type_map:
             raise ValueError(
@@ -1431,6 +1669,7 @@ class SolverHighs(mip.Solver):
         return self._highs_type_map[var_type[0]]
 
     def var_set_var_type(self: "SolverHighs", var: "mip.Var", value: str):
+        self._flush()
         if value not in self._var_type_map:
             raise ValueError(f"Invalid variable type: {value}")
         prev_var_type = var.var_type
@@ -1446,13 +1685,14 @@ class SolverHighs(mip.Solver):
                 self._num_int_vars += 1
 
     def var_get_column(self: "SolverHighs", var: "mip.Var") -> "mip.Column":
+        self._flush()
         # Call method twice:
         #  - first, to get the sizes for coefficients,
-        num_col = ffi.new("int*")
+        num_col = ffi.new("int[1]")
         costs = ffi.new("double[]", 1)
         lower = ffi.new("double[]", 1)
         upper = ffi.new("double[]", 1)
-        num_nz = ffi.new("int*")
+        num_nz = ffi.new("int[1]")
         check(
             self._lib.Highs_getColsByRange(
                 self._model,
@@ -1489,8 +1729,10 @@ class SolverHighs(mip.Solver):
         )
 
         return mip.Column(
-            constrs=[self.model.constrs[matrix_index[i]] for i in range(num_nz[0])],
-            coeffs=[matrix_value[i] for i in range(num_nz[0])],
+            constrs=[
+                self.model.constrs[row] for row in _view(matrix_index, np.int32).tolist()
+            ],
+            coeffs=_view(matrix_value).tolist(),
         )
 
     def var_set_column(self: "SolverHighs", var: "mip.Var", value: "mip.Column"):
@@ -1508,17 +1750,26 @@ class SolverHighs(mip.Solver):
         raise NotImplementedError("HiGHS doesn't store multiple solutions.")
 
     def var_get_name(self: "SolverHighs", idx: int) -> str:
+        self._flush()
         name = self._name_buffer
         check(self._lib.Highs_getColName(self._model, idx, name))
         return ffi.string(name).decode("utf-8")
 
     def remove_vars(self: "SolverHighs", varsList: List[int]):
+        self._flush()
         set_ = ffi.new("int[]", varsList)
         check(self._lib.Highs_deleteColsBySet(self._model, len(varsList), set_))
+        self._sync_dimensions()
 
     def var_get_index(self: "SolverHighs", name: str) -> int:
-        idx = ffi.new("int *")
-        self._lib.Highs_getColByName(self._model, name.encode("utf-8"), idx)
+        if not name:
+            # unnamed columns can't be looked up
+            return -1
+        self._flush()
+        idx = ffi.new("int[1]")
+        status = self._lib.Highs_getColByName(self._model, name.encode("utf-8"), idx)
+        if status == STATUS_ERROR:
+            return -1
         return idx[0]
 
     def get_problem_name(self: "SolverHighs") -> str:
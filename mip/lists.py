@@ -59,6 +59,12 @@ class VarList(Sequence):
     def update_vars(self: "VarList", n_vars: int):
         self.__vars = [mip.Var(self.__model, i) for i in range(n_vars)]
 
+    def truncate(self: "VarList", n_vars: int):
+        "Drop all but the first n_vars variables (no longer in the solver)."
+        for v in self.__vars[n_vars:]:
+            v._idx = -1
+        del self.__vars[n_vars:]
+
     def remove(self: "VarList", vars: List["mip.Var"]):
         iv = [1 for i in range(len(self.__vars))]
         vlist = [v.idx for v in vars]
@@ -176,6 +182,12 @@ class ConstrList(Sequence):
     def update_constrs(self: "ConstrList", n_constrs: int):
         self.__constrs = [mip.Constr(self.__model, i) for i in range(n_constrs)]
 
+    def truncate(self: "ConstrList", n_constrs: int):
+        "Drop all but the first n_constrs constraints (no longer in the solver)."
+        for c in self.__constrs[n_constrs:]:
+            c.idx = -1
+        del self.__constrs[n_constrs:]
+
 
 # same as previous class, but does not stores
 # anything and does not allows modification,
@@ -1478,3 +1478,126 @@ def test_solve_relaxation(solver):
         assert c1.slack == pytest.approx(0.0)
         assert c2.slack == pytest.approx(0.0)
         assert c3.slack == pytest.approx(0.0)
+
+
+@pytest.mark.skipif(not mip.highs.has_highs, reason="HiGHS not available")
+def test_interleaved_addition_of_vars_and_constrs():
+    # exercises the buffering of new columns and rows in SolverHighs
+    m = Model(solver_name=HIGHS)
+    x = m.add_var("x", var_type=INTEGER, ub=10)
+    c1 = m.add_constr(x <= 5.5, name="c1")
+    # column referring to a constraint that was just added
+    y = m.add_var("y", obj=-1, column=Column([c1], [1]))
+    c2 = m.add_constr(x - y >= 1, name="c2")
+    m.objective = mip.minimize(-2 * x - y)
+
+    assert m.num_cols == 2
+    assert m.num_rows == 2
+    assert m.num_int == 1
+    assert m.var_by_name("y").idx == y.idx
+    assert m.constr_by_name("c2").idx == c2.idx
+    assert c1.expr.expr == pytest.approx({x: 1.0, y: 1.0})
+    assert y.var_type == CONTINUOUS
+
+    status = m.optimize()
+    assert status == OptimizationStatus.OPTIMAL
+    assert x.x == pytest.approx(5.0)
+    assert y.x == pytest.approx(0.5)
+
+
+@pytest.mark.skipif(not mip.highs.has_highs, reason="HiGHS not available")
+def test_rejected_vars_and_constrs_leave_model_usable():
+    m = Model(solver_name=HIGHS)
+    x = m.add_var("x", ub=10)
+    other = Model(solver_name=HIGHS)
+    other_vars = [other.add_var() for _ in range(3)]
+    other_constrs = [other.add_constr(v <= 1) for v in other_vars]
+
+    # invalid indices are rejected right away
+    with pytest.raises(mip.InterfacingError):
+        m.add_constr(x + other_vars[2] <= 1)
+    with pytest.raises(mip.InterfacingError):
+        m.add_var("y", column=Column([other_constrs[2]], [1]))
+    assert m.num_cols == 1
+    assert m.num_rows == 0
+
+    # so is data that HiGHS would only reject once the buffers are passed to it
+    c = m.add_constr(x <= 5)
+    with pytest.raises(mip.InterfacingError):
+        m.add_constr(1e30 * x <= 1)
+    with pytest.raises(mip.InterfacingError):
+        m.add_constr(float("nan") * x <= 1)
+    with pytest.raises(mip.InterfacingError):
+        m.add_constr(x >= mip.INF)
+    with pytest.raises(mip.InterfacingError):
+        m.add_var("y", lb=float("nan"))
+    with pytest.raises(mip.InterfacingError):
+        m.add_var("y", column=Column([c], [1e30]))
+    assert m.num_cols == 1
+    assert m.num_rows == 1
+    assert len(m.vars) == 1
+    assert len(m.constrs) == 1
+
+    m.objective = mip.maximize(x)
+    assert c.idx == 0
+    assert x.lb == 0
+    assert m.optimize() == OptimizationStatus.OPTIMAL
+    assert x.x == pytest.approx(5.0)
+
+
+@pytest.mark.skipif(not mip.highs.has_highs, reason="HiGHS not available")
+def test_query_by_unknown_or_empty_name():
+    m = Model(solver_name=HIGHS)
+    x = m.add_var("x")
+    m.add_var()
+    m.add_constr(x <= 1, name="c")
+
+    assert m.var_by_name("x") is x
+    assert m.var_by_name("") is None
+    assert m.var_by_name("y") is None
+    assert m.constr_by_name("c").idx == 0
+    assert m.constr_by_name("") is None
+    assert m.constr_by_name("d") is None
+
+
+@skip_on(NotImplementedError)
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_replace_objective_with_fewer_terms(solver):
+    m = Model(solver_name=solver, sense=MAXIMIZE)
+    x = m.add_var(name="x", lb=0, ub=1)
+    y = m.add_var(name="y", lb=0, ub=1)
+
+    m.objective = x + 2 * y
+    assert len(m.objective.expr) == 2
+
+    # y must not remain in the objective
+    m.objective = x
+    assert m.objective.expr == {x: 1}
+
+    status = m.optimize()
+    assert status == OptimizationStatus.OPTIMAL
+    assert m.objective_value == pytest.approx(1.0)
+
+
+@pytest.mark.skipif(not mip.highs.has_highs, reason="HiGHS not available")
+def test_objective_with_unknown_variables():
+    m = Model(solver_name=HIGHS, sense=MAXIMIZE)
+    x = m.add_var(name="x", lb=0, ub=1)
+    y = m.add_var(name="y", lb=0, ub=1)
+    other = Model(solver_name=HIGHS)
+    other_vars = [other.add_var() for _ in range(3)]
+    m.objective = x
+    m.remove(x)
+    assert x.idx == -1
+
+    # neither a removed variable nor one of another model may end up in the
+    # objective (e.g., as coefficient of the last column)
+    with pytest.raises(mip.InterfacingError):
+        m.objective = x + y
+    with pytest.raises(mip.InterfacingError):
+        m.objective = y + other_vars[2]
+
+    m.objective = 2 * y
+    assert m.objective.expr == {y: 2}
+    assert m.optimize() == OptimizationStatus.OPTIMAL
+    assert m.objective_value == pytest.approx(2.0)